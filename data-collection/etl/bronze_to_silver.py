@@ -2,13 +2,25 @@
 import os
 import io
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 
 from minio import Minio
+import numpy as np
 import pandas as pd
+from psycopg2.extras import execute_values
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 
+try:
+    # JSONL 파싱 가속용 (없으면 표준 json 사용 - Airflow 컨테이너 등)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 load_dotenv()
 
 
@@ -24,7 +36,51 @@ MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
 MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
 
-engine = create_engine(PG_URL)
+# COPY 버퍼를 flush 하는 크기 (MB)
+# (row 수가 아니라 버퍼 크기 기준: FrameSize 4096 이면 row 하나가 ~100KB hex 텍스트)
+FRAME_COPY_FLUSH_BYTES = int(os.getenv("FRAME_COPY_FLUSH_MB", "32")) * 1024 * 1024
+
+# 세션 object 병렬 다운로드 설정
+# (세션 worker 프로세스마다 적용되므로 prefetch 는 작게: 메모리 상한 = raw bytes × prefetch × 프로세스 수)
+MINIO_DOWNLOAD_WORKERS = int(os.getenv("MINIO_DOWNLOAD_WORKERS", "4"))
+MINIO_PREFETCH_OBJECTS = int(os.getenv("MINIO_PREFETCH_OBJECTS", "4"))
+
+# bulk load 후 raw.vibration_frame 을 PK 순서로 CLUSTER 할지 여부 (테이블 rewrite)
+VIBRATION_FRAME_CLUSTER = os.getenv("VIBRATION_FRAME_CLUSTER", "false").lower() == "true"
+
+# 세션 병렬 처리 프로세스 수 (1 이하이면 현재 프로세스에서 순차 처리)
+ETL_SESSION_WORKERS = int(os.getenv("ETL_SESSION_WORKERS", str(os.cpu_count() or 1)))
+
+# executemany_mode="values_plus_batch": executemany INSERT 는 multi-VALUES, 나머지는 execute_batch 로 전송
+engine = create_engine(
+    PG_URL,
+    pool_pre_ping=True,
+    pool_size=16,
+    executemany_mode="values_plus_batch",
+)
+
+# ax/ay/az 저장 포맷: little-endian float32 를 그대로 이어붙인 BYTEA
+AXIS_DTYPE = np.dtype("<f4")
+
+# raw.vibration_frame INSERT 컬럼 순서
+FRAME_COLUMNS = (
+    "session_id",
+    "device_id",
+    "frame_seq",
+    "t0_utc",
+    "samples_per_frame",
+    "ax",
+    "ay",
+    "az",
+    "task_type",
+    "label_type",
+    "data_split",
+    "operator",
+)
+FRAME_COPY_SQL = (
+    f"COPY raw.vibration_frame ({', '.join(FRAME_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT text)"
+)
 
 
 def make_minio_client() -> Minio:
@@ -51,13 +107,17 @@ def parse_s3_url(s3_url: str):
     return bucket, key
 
 
+# <session prefix>_000001.jsonl 형태의 object key
+_SESSION_PREFIX_RE = re.compile(r"^(.*)_\d{6}\.[^.]+$")
+
+
 def derive_session_prefix_from_key(key: str) -> str:
     """
     M001/2025/11/26/20251126_165513_M001_anomaly_normal_000001.jsonl
     → M001/2025/11/26/20251126_165513_M001_anomaly_normal_
     (뒤의 _000001.jsonl 부분 제거)
     """
-    m = re.match(r"^(.*)_\d{6}\.[^.]+$", key)
+    m = _SESSION_PREFIX_RE.match(key)
     if not m:
         # 패턴이 다르면 그냥 디렉터리 기준 prefix로 사용
         # M001/2025/11/26/20251126_165513_M001_anomaly_normal_000001.jsonl
@@ -66,24 +126,76 @@ def derive_session_prefix_from_key(key: str) -> str:
     return m.group(1) + "_"  # 마지막 '_' 포함
 
 
+@lru_cache(maxsize=64)
+def _list_dir_objects(client: Minio, bucket: str, dir_prefix: str) -> tuple[str, ...]:
+    """
+    device/YYYY/MM/DD/ 디렉터리 단위 listing 캐시.
+    같은 날짜 폴더의 세션이 여러 개면 MinIO list 요청은 한 번만 나간다 (실행 중에만 유효).
+    """
+    objects = client.list_objects(bucket, prefix=dir_prefix, recursive=False)
+    return tuple(obj.object_name for obj in objects)
+
+
 def list_session_objects(client: Minio, bucket: str, prefix: str):
     """
     세션 prefix로 시작하는 .jsonl 파일들 리스트
+    (디렉터리 listing 을 캐시에서 가져와 Python 에서 prefix 필터)
     """
-    objects = client.list_objects(bucket, prefix=prefix, recursive=False)
-    return [obj.object_name for obj in objects if obj.object_name.endswith(".jsonl")]
+    dir_prefix = prefix.rsplit("/", 1)[0] + "/" if "/" in prefix else ""
+    return [
+        name
+        for name in _list_dir_objects(client, bucket, dir_prefix)
+        if name.startswith(prefix) and name.endswith(".jsonl")
+    ]
 
 
-def read_jsonl_from_minio(client: Minio, bucket: str, object_name: str) -> pd.DataFrame:
+def download_object_bytes(client: Minio, bucket: str, object_name: str) -> bytes:
+    """
+    object 원본(JSONL bytes) 다운로드. 파싱은 소비 측(iter_jsonl_records)에서 lazy 하게.
+    (Python dict / float list 로 미리 풀어두는 것보다 메모리가 수 배 작다)
+    """
     resp = client.get_object(bucket, object_name)
     try:
-        data = resp.read()
+        return resp.read()
     finally:
         resp.close()
         resp.release_conn()
-    buf = io.BytesIO(data)
-    df = pd.read_json(buf, lines=True)
-    return df
+
+
+def iter_jsonl_records(data: bytes):
+    """
+    JSONL bytes → 줄 단위로 파싱한 dict 를 하나씩 yield (전체 record list 를 만들지 않음)
+    """
+    for line in io.BytesIO(data):
+        if line.strip():
+            yield json_loads(line)
+
+
+def iter_session_objects(client: Minio, bucket: str, object_names: list[str]):
+    """
+    object 들을 ThreadPoolExecutor 로 병렬 다운로드하면서 (object_name, raw bytes) 를 순서대로 yield.
+    미리 받아두는 object 수는 MINIO_PREFETCH_OBJECTS 로 제한 (메모리 상한 = raw bytes × prefetch 수).
+    Minio client 는 urllib3 pool 기반이라 스레드 간 공유 가능.
+    """
+    pending = deque()
+    names = iter(object_names)
+    # 0 이하로 설정돼도 최소 1개는 받아야 순차 다운로드로 동작 (0 이면 아무 object 도 안 읽힘)
+    prefetch = max(1, MINIO_PREFETCH_OBJECTS)
+    n_workers = max(1, min(MINIO_DOWNLOAD_WORKERS, prefetch))
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for obj in islice(names, prefetch):
+            pending.append((obj, executor.submit(download_object_bytes, client, bucket, obj)))
+
+        while pending:
+            obj, fut = pending.popleft()
+            data = fut.result()
+
+            nxt = next(names, None)
+            if nxt is not None:
+                pending.append((nxt, executor.submit(download_object_bytes, client, bucket, nxt)))
+
+            yield obj, data
 
 
 def ensure_vibration_frame_table():
@@ -100,20 +212,138 @@ def ensure_vibration_frame_table():
         frame_seq           BIGINT NOT NULL,
         t0_utc              TIMESTAMPTZ NOT NULL,
         samples_per_frame   INTEGER NOT NULL,
-        ax                  DOUBLE PRECISION[] NOT NULL,
-        ay                  DOUBLE PRECISION[] NOT NULL,
-        az                  DOUBLE PRECISION[] NOT NULL,
+        ax                  BYTEA NOT NULL,   -- float32 little-endian packed
+        ay                  BYTEA NOT NULL,
+        az                  BYTEA NOT NULL,
         -- 메타데이터 (NULL 허용)
         task_type           TEXT,
         label_type          TEXT,
         data_split          TEXT,
         operator            TEXT,
         PRIMARY KEY (session_id, frame_seq)
-    );
+    ) WITH (fillfactor = 100);
     """
     with engine.begin() as conn:
         conn.execute(text(ddl))
 
+    # session_id 범위 필터용 BRIN (append-only 테이블이라 PK btree 보다 훨씬 작음)
+    # CREATE INDEX CONCURRENTLY 는 트랜잭션 밖에서 실행해야 함
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(
+            text(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS vibration_frame_brin
+                ON raw.vibration_frame USING BRIN (session_id)
+                WITH (pages_per_range = 32);
+                """
+            )
+        )
+
+
+def cluster_vibration_frame():
+    """
+    bulk load 후 raw.vibration_frame 을 PK (session_id, frame_seq) 순서로 물리 재정렬.
+    frames_to_features 의 세션별 ORDER BY frame_seq 읽기가 정렬 없이 순차 I/O 가 되도록.
+    테이블 전체를 다시 쓰고 ACCESS EXCLUSIVE lock 을 잡으므로 VIBRATION_FRAME_CLUSTER=true 일 때만.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("CLUSTER raw.vibration_frame USING vibration_frame_pkey;"))
+        conn.execute(text("ANALYZE raw.vibration_frame;"))
+
+    print("[ETL] raw.vibration_frame clustered by (session_id, frame_seq)")
+
+
+def migrate_axis_arrays_to_bytea(batch_rows: int = 2000):
+    """
+    마이그레이션용:
+    기존 raw.vibration_frame 의 ax/ay/az 가 DOUBLE PRECISION[] 이면
+    float32 packed BYTEA 로 변환 (이미 BYTEA 면 아무것도 하지 않음).
+    새 BYTEA 컬럼을 추가 → server-side cursor 로 읽으며 채움 → 기존 컬럼 drop/rename.
+    전체가 하나의 트랜잭션.
+    """
+    check_sql = text(
+        """
+        SELECT data_type
+        FROM information_schema.columns
+        WHERE table_schema = 'raw'
+          AND table_name = 'vibration_frame'
+          AND column_name = 'ax';
+        """
+    )
+    with engine.connect() as conn:
+        data_type = conn.execute(check_sql).scalar()
+
+    if data_type != "ARRAY":
+        return
+
+    print("[ETL] migrating raw.vibration_frame ax/ay/az: DOUBLE PRECISION[] -> BYTEA(float32)")
+
+    conn = engine.raw_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                ALTER TABLE raw.vibration_frame
+                    ADD COLUMN ax_f32 BYTEA,
+                    ADD COLUMN ay_f32 BYTEA,
+                    ADD COLUMN az_f32 BYTEA;
+                """
+            )
+
+        total = 0
+        with conn.cursor(name="vibration_frame_migrate") as read_cur, conn.cursor() as write_cur:
+            read_cur.itersize = batch_rows
+            read_cur.execute(
+                "SELECT session_id, frame_seq, ax, ay, az FROM raw.vibration_frame"
+            )
+            while True:
+                rows = read_cur.fetchmany(batch_rows)
+                if not rows:
+                    break
+                packed = [
+                    (sid, seq, pack_axis(ax), pack_axis(ay), pack_axis(az))
+                    for sid, seq, ax, ay, az in rows
+                ]
+                execute_values(
+                    write_cur,
+                    """
+                    UPDATE raw.vibration_frame vf
+                    SET ax_f32 = v.ax, ay_f32 = v.ay, az_f32 = v.az
+                    FROM (VALUES %s) AS v(session_id, frame_seq, ax, ay, az)
+                    WHERE vf.session_id = v.session_id
+                      AND vf.frame_seq = v.frame_seq;
+                    """,
+                    packed,
+                    page_size=batch_rows,
+                )
+                total += len(rows)
+                print(f"[ETL] migrated {total} frames")
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                ALTER TABLE raw.vibration_frame
+                    DROP COLUMN ax,
+                    DROP COLUMN ay,
+                    DROP COLUMN az;
+                ALTER TABLE raw.vibration_frame RENAME COLUMN ax_f32 TO ax;
+                ALTER TABLE raw.vibration_frame RENAME COLUMN ay_f32 TO ay;
+                ALTER TABLE raw.vibration_frame RENAME COLUMN az_f32 TO az;
+                ALTER TABLE raw.vibration_frame
+                    ALTER COLUMN ax SET NOT NULL,
+                    ALTER COLUMN ay SET NOT NULL,
+                    ALTER COLUMN az SET NOT NULL;
+                """
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"[ETL] migration done, frames={total}")
+
 
 def sync_bronze_status_from_raw():
     """
@@ -172,20 +402,26 @@ def fetch_uningested_sessions() -> pd.DataFrame:
     return df
 
 
-def mark_session_bronze_done(session_id: int):
+def mark_sessions_bronze_done(session_ids: list[int]):
     """
-    세션 bronze 처리 완료 마킹
+    세션 bronze 처리 완료 마킹 (한 번의 UPDATE / 트랜잭션으로 일괄 처리)
+    중간에 프로세스가 죽어서 마킹이 누락되어도 다음 실행의 sync_bronze_status_from_raw 가 보정한다.
     """
+    if not session_ids:
+        return
+
     sql = text(
         """
         UPDATE session
         SET bronze_done_at = NOW(),
             force_reprocess = FALSE
-        WHERE id = :sid;
+        WHERE id = ANY(:ids);
         """
     )
     with engine.begin() as conn:
-        conn.execute(sql, {"sid": session_id})
+        conn.execute(sql, {"ids": session_ids})
+
+    print(f"[ETL] marked bronze_done_at for {len(session_ids)} sessions")
 
 
 def delete_existing_frames_if_any(session_id: int):
@@ -203,7 +439,11 @@ def delete_existing_frames_if_any(session_id: int):
         conn.execute(sql, {"sid": session_id})
 
 
-def process_one_session(row, client: Minio):
+def process_one_session(row, client: Minio) -> bool:
+    """
+    세션 하나의 raw object 들을 raw.vibration_frame 으로 적재.
+    반환값: 적재된 row 가 있으면 True (bronze_done_at 마킹 대상)
+    """
     session_id = int(row["id"])
     device_id = row["device_id"]
     raw_file_path = row["raw_file_path"]
@@ -234,147 +474,203 @@ def process_one_session(row, client: Minio):
     object_names = list_session_objects(client, bucket, prefix)
     if not object_names:
         print(f"[ETL] no objects found for session_id={session_id}")
-        return
+        return False
 
     print(f"[ETL] found {len(object_names)} objects")
 
+    # 세션 공통 컬럼(session_id, device_id / 메타데이터)은 한 번만 COPY 텍스트로 변환
+    head = f"{session_id}\t{_copy_text_field(device_id)}"
+    tail = "\t".join(
+        _copy_text_field(v) for v in (task_type, label_type, data_split, operator)
+    )
+
     total_rows = 0
+    # COPY 버퍼는 bytes 로 유지 (StringIO 는 seek/read 시 UCS-4 로 커져서 메모리 4배)
+    buf = io.BytesIO()
+    buf_rows = 0
+
+    # object 다운로드는 스레드 풀로 병렬 처리, DB 쓰기는 현재 스레드에서 순서대로 flush
+    # JSONL record → COPY 텍스트 라인으로 바로 기록 (pandas 거치지 않음)
+    for obj, data in iter_session_objects(client, bucket, sorted(object_names)):
+        obj_rows = 0
+        for rec in iter_jsonl_records(data):
+            # 컬럼 체크
+            if "seq" not in rec or "t0" not in rec:
+                raise RuntimeError(
+                    f"unexpected columns in jsonl for session {session_id}, "
+                    f"object={obj}: {list(rec.keys())}"
+                )
+            # 축 데이터가 없거나 null 이면 NaN BYTEA / samples_per_frame=0 으로 들어가지 않도록 중단
+            missing_axes = [k for k in ("ax", "ay", "az") if rec.get(k) is None]
+            if missing_axes:
+                raise RuntimeError(
+                    f"missing axis data {missing_axes} in jsonl for session {session_id}, "
+                    f"object={obj}, seq={rec['seq']}"
+                )
+            buf.write(format_frame_copy_line(head, rec, tail).encode("utf-8"))
+            buf_rows += 1
+            obj_rows += 1
+
+            if buf.tell() >= FRAME_COPY_FLUSH_BYTES:
+                copy_frames_to_pg(buf, buf_rows)
+                total_rows += buf_rows
+                buf = io.BytesIO()
+                buf_rows = 0
+
+        del data
+        print(f"[ETL] session_id={session_id}, object={obj}, rows={obj_rows}")
+
+    if buf_rows > 0:
+        copy_frames_to_pg(buf, buf_rows)
+        total_rows += buf_rows
 
-    # object 하나씩 읽어서 바로 DB로 flush
-    for obj in sorted(object_names):
-        df = read_jsonl_from_minio(client, bucket, obj)
+    print(f"[ETL] session_id={session_id} done, total_rows={total_rows}")
 
-        if df.empty:
-            continue
+    if total_rows == 0:
+        print(f"[ETL] WARN: session_id={session_id} had no rows, bronze_done_at not updated")
+    return total_rows > 0
 
-        # 컬럼 체크
-        if "seq" not in df.columns or "t0" not in df.columns:
-            raise RuntimeError(
-                f"unexpected columns in jsonl for session {session_id}, "
-                f"object={obj}: {df.columns}"
-            )
 
-        # t0 → timestamp
-        df["t0"] = pd.to_datetime(df["t0"], utc=True)
+def pack_axis(arr) -> bytes:
+    """
+    [0.1, 0.2, ...] → float32 little-endian bytes (raw.vibration_frame ax/ay/az 포맷)
+    """
+    return np.asarray(arr, dtype=AXIS_DTYPE).tobytes()
 
-        # samples_per_frame = len(ax)
-        df["samples_per_frame"] = df["ax"].apply(
-            lambda a: len(a) if isinstance(a, (list, tuple)) else 0
-        )
 
-        # session_id / device_id 붙이기
-        df["session_id"] = session_id
-        df["device_id"] = device_id
-
-        # 세션 메타데이터 붙이기 (frame별로 동일)
-        df["task_type"] = task_type
-        df["label_type"] = label_type
-        df["data_split"] = data_split
-        df["operator"] = operator
-
-        out_df = df[
-            [
-                "session_id",
-                "device_id",
-                "seq",
-                "t0",
-                "samples_per_frame",
-                "ax",
-                "ay",
-                "az",
-                "task_type",
-                "label_type",
-                "data_split",
-                "operator",
-            ]
-        ].rename(
-            columns={
-                "seq": "frame_seq",
-                "t0": "t0_utc",
-            }
-        )
+def _copy_bytea_field(arr) -> str:
+    """
+    축 데이터 → COPY (FORMAT text) 용 BYTEA hex 필드 ('\\x...', 백슬래시는 COPY escape)
+    """
+    return "\\\\x" + pack_axis(arr).hex()
 
-        write_frames_to_pg(out_df)
-        total_rows += len(out_df)
-        print(f"[ETL] session_id={session_id}, object={obj}, rows={len(out_df)}")
 
-    print(f"[ETL] session_id={session_id} done, total_rows={total_rows}")
+def _copy_text_field(v) -> str:
+    """
+    COPY (FORMAT text) 필드 값으로 변환. None/NaN/pd.NA/NaT → \\N, 특수문자는 escape.
+    """
+    if v is None or (pd.api.types.is_scalar(v) and pd.isna(v)):
+        return "\\N"
+    return (
+        str(v)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
-    if total_rows > 0:
-        mark_session_bronze_done(session_id)
-    else:
-        print(f"[ETL] WARN: session_id={session_id} had no rows, bronze_done_at not updated")
+
+def format_frame_copy_line(head: str, rec: dict, tail: str) -> str:
+    """
+    JSONL record 한 줄 → raw.vibration_frame COPY 텍스트 라인
+    head: session_id, device_id 부분 / tail: task_type, label_type, data_split, operator 부분
+    (둘 다 탭 구분, 세션 단위로 미리 만들어 둔 문자열)
+    ax/ay/az 가 없거나 null 인 record 는 호출 측(process_one_session)에서 미리 걸러서 예외 처리.
+    """
+    ax = rec["ax"]
+    ay = rec["ay"]
+    az = rec["az"]
+    samples_per_frame = len(ax)
+
+    return (
+        f"{head}\t{int(rec['seq'])}\t{_copy_text_field(rec['t0'])}\t{samples_per_frame}\t"
+        f"{_copy_bytea_field(ax)}\t{_copy_bytea_field(ay)}\t{_copy_bytea_field(az)}\t"
+        f"{tail}\n"
+    )
 
 
-def write_frames_to_pg(df: pd.DataFrame):
+def copy_frames_to_pg(buf: io.BytesIO, n_rows: int):
     """
-    pandas → raw.vibration_frame
-    Postgres array 타입에 Python list가 잘 매핑되도록 to_sql 사용
+    COPY 텍스트(UTF-8 bytes) 버퍼 → raw.vibration_frame
+    COPY ... FROM STDIN (FORMAT text) 로 적재 (INSERT 대비 row 별 parse/plan 없음)
+    timezone 없는 t0 도 기존(pd.to_datetime(utc=True))과 같이 UTC 로 해석되도록 세션 TZ 를 UTC 로 고정.
     """
-    if df.empty:
+    if n_rows == 0:
         return
 
-    from sqlalchemy import (
-        Table,
-        Column,
-        MetaData,
-        BigInteger,
-        Integer,
-        Text,
-    )
-    from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, TIMESTAMP
-
-    metadata = MetaData()
-    vibration_frame = Table(
-        "vibration_frame",
-        metadata,
-        Column("session_id", BigInteger, nullable=False),
-        Column("device_id", Text, nullable=False),
-        Column("frame_seq", BigInteger, nullable=False),
-        Column("t0_utc", TIMESTAMP(timezone=True), nullable=False),
-        Column("samples_per_frame", Integer, nullable=False),
-        Column("ax", ARRAY(DOUBLE_PRECISION), nullable=False),
-        Column("ay", ARRAY(DOUBLE_PRECISION), nullable=False),
-        Column("az", ARRAY(DOUBLE_PRECISION), nullable=False),
-        # 메타데이터 컬럼 (NULL 허용)
-        Column("task_type", Text, nullable=True),
-        Column("label_type", Text, nullable=True),
-        Column("data_split", Text, nullable=True),
-        Column("operator", Text, nullable=True),
-        schema="raw",
-    )
+    buf.seek(0)
 
-    # to_sql을 쓰되, index=False + if_exists='append'
-    with engine.begin() as conn:
-        df.to_sql(
-            name=vibration_frame.name,
-            schema=vibration_frame.schema,
-            con=conn,
-            if_exists="append",
-            index=False,
-            method="multi",
-        )
+    conn = engine.raw_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL TIME ZONE 'UTC'")
+            cur.copy_expert(FRAME_COPY_SQL, buf)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"[ETL] copied {n_rows} rows into raw.vibration_frame")
 
-    print(f"[ETL] inserted {len(df)} rows into raw.vibration_frame")
+
+# ----------------- 세션 병렬 처리 (ProcessPoolExecutor) -----------------
+
+_worker_client = None
+
+
+def _init_session_worker():
+    """
+    자식 프로세스 초기화: 부모에서 열린 DB 커넥션은 공유하면 안 되므로 pool 을 버리고
+    (close=False → 부모 소켓은 건드리지 않음) MinIO client 도 새로 만든다.
+    """
+    global _worker_client
+    engine.dispose(close=False)
+    _worker_client = make_minio_client()
+
+
+def _process_session_worker(row: dict):
+    """
+    자식 프로세스에서 세션 하나 처리 → (session_id, 성공 여부, 에러 메시지)
+    """
+    try:
+        return row["id"], process_one_session(row, _worker_client), None
+    except Exception as ex:
+        return row["id"], False, str(ex)
 
 
 def main():
     ensure_vibration_frame_table()
+    # 기존 DOUBLE PRECISION[] 테이블이면 BYTEA(float32) 로 변환 (마이그레이션용)
+    migrate_axis_arrays_to_bytea()
     # 기존 데이터에 대해 bronze_done_at 자동 동기화 (마이그레이션용)
     sync_bronze_status_from_raw()
 
-    client = make_minio_client()
-
     sessions_df = fetch_uningested_sessions()
     if sessions_df.empty:
         print("[ETL] no sessions to process")
         return
 
-    for _, row in sessions_df.iterrows():
-        try:
-            process_one_session(row, client)
-        except Exception as ex:
-            print(f"[ETL] ERROR on session_id={row['id']}: {ex}")
+    rows = sessions_df.to_dict("records")
+
+    done_session_ids = []
+    try:
+        if ETL_SESSION_WORKERS <= 1 or len(rows) == 1:
+            client = make_minio_client()
+            for row in rows:
+                try:
+                    if process_one_session(row, client):
+                        done_session_ids.append(int(row["id"]))
+                except Exception as ex:
+                    print(f"[ETL] ERROR on session_id={row['id']}: {ex}")
+        else:
+            # 세션끼리는 공유 상태가 없어서 프로세스 단위로 병렬 처리 (네트워크 + DB bound)
+            engine.dispose()
+            with ProcessPoolExecutor(
+                max_workers=min(ETL_SESSION_WORKERS, len(rows)),
+                initializer=_init_session_worker,
+            ) as executor:
+                for session_id, ok, err in executor.map(_process_session_worker, rows):
+                    if err is not None:
+                        print(f"[ETL] ERROR on session_id={session_id}: {err}")
+                    elif ok:
+                        done_session_ids.append(int(session_id))
+    finally:
+        mark_sessions_bronze_done(done_session_ids)
+
+    if done_session_ids and VIBRATION_FRAME_CLUSTER:
+        cluster_vibration_frame()
 
 
 if __name__ == "__main__":
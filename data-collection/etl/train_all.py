@@ -0,0 +1,33 @@
+# 파일: train_all.py
+# 이상 탐지 + 결함 진단 모델을 한 프로세스에서 순차 학습
+# (mart.vibration_frame_features 는 한 번만 로드/피벗 후 task_type 으로 메모리에서 분할)
+import train_anomaly_model as anomaly
+import train_fault_model as fault
+from train_common import load_feature_df, parse_args, train_and_log
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    df_all = load_feature_df(anomaly.TASK_TYPES + fault.TASK_TYPES, tag="TRAIN-ALL")
+    print(f"[TRAIN-ALL] loaded features df shape = {df_all.shape}")
+
+    # fit 은 n_jobs 로 코어를 이미 다 쓰므로 두 모델은 병렬이 아니라 순차로 학습
+    train_and_log(
+        model_type=args.model_type,
+        task_types=anomaly.TASK_TYPES,
+        task_name="anomaly_detection",
+        experiment_name=anomaly.MLFLOW_EXPERIMENT_NAME,
+        onnx_prefix="anomaly",
+        tag="TRAIN-ANOM",
+        df=df_all,
+    )
+    train_and_log(
+        model_type=args.model_type,
+        task_types=fault.TASK_TYPES,
+        task_name="fault_diagnosis",
+        experiment_name=fault.MLFLOW_EXPERIMENT_NAME,
+        onnx_prefix="fault",
+        tag="TRAIN-FAULT",
+        mark_trained=True,
+        df=df_all,
+    )